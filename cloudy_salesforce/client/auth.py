@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
+import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 
 class BaseAuthentication(ABC):
@@ -22,10 +25,55 @@ class BaseAuthentication(ABC):
 import logging
 from requests.exceptions import HTTPError
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Size of the keep-alive pool, large enough for concurrent collection batches
+POOL_SIZE = 16
+
+# Statuses where Salesforce rejected the request without processing it, so
+# resending it cannot apply the same change twice
+UNPROCESSED_STATUSES = frozenset([429, 503])
+
+
+class _DMLSafeRetry(Retry):
+    """
+    Retries GET on any transient error, but other methods only on statuses
+    in UNPROCESSED_STATUSES.
+
+    A POST, PATCH or DELETE that failed with a 500/502/504 or a read error may
+    already have been applied; an upsert by Id inserts records without one and
+    a repeated delete fails with ENTITY_IS_DELETED, so those are left to the
+    caller.
+    """
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if self._is_method_retryable(method):
+            return super().is_retry(method, status_code, has_retry_after)
+        return status_code in UNPROCESSED_STATUSES
+
+
+RETRY_POLICY = _DMLSafeRetry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=frozenset(["GET"]),
+    raise_on_status=False,
+)
+
+_SESSION_RE = re.compile(rb"<sessionId>([^<]+)</sessionId>")
+_SERVER_RE = re.compile(rb"<serverUrl>([^<]+)</serverUrl>")
+
+_SOAP_TEMPLATE = """
+<env:Envelope xmlns:xsd="http://www.w3.org/2001/XMLSchema" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xmlns:env="http://schemas.xmlsoap.org/soap/envelope/">
+    <env:Body>
+        <n1:login xmlns:n1="urn:partner.soap.sforce.com">
+            <n1:username>{username}</n1:username>
+            <n1:password>{password}</n1:password>
+        </n1:login>
+    </env:Body>
+</env:Envelope>
+""".format
+
 
 class UsernamePasswordAuthentication(BaseAuthentication):
     def __init__(self, username, password, security_token):
@@ -38,48 +86,59 @@ class UsernamePasswordAuthentication(BaseAuthentication):
 
     def authenticate(self):
         session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE,
+            max_retries=RETRY_POLICY,
+        )
+        session.mount("https://", adapter)
+        session.headers["Connection"] = "keep-alive"
         auth_url = "https://login.salesforce.com/services/Soap/u/52.0"
         headers = {"Content-Type": "text/xml", "SOAPAction": "login"}
-        soap_body = f"""
-        <env:Envelope xmlns:xsd="http://www.w3.org/2001/XMLSchema" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xmlns:env="http://schemas.xmlsoap.org/soap/envelope/">
-            <env:Body>
-                <n1:login xmlns:n1="urn:partner.soap.sforce.com">
-                    <n1:username>{self.username}</n1:username>
-                    <n1:password>{self.password}{self.security_token}</n1:password>
-                </n1:login>
-            </env:Body>
-        </env:Envelope>
-        """
+        soap_body = _SOAP_TEMPLATE(
+            username=self.username,
+            password=f"{self.password}{self.security_token}",
+        )
         try:
-            response = session.post(auth_url, headers=headers, data=soap_body)
-            response.raise_for_status()
-            response_content = response.content.decode("utf-8")
-            if "faultstring" in response_content:
-                raise Exception(f"SOAP Fault: {response_content}")
+            with session.post(
+                auth_url, headers=headers, data=soap_body, stream=True
+            ) as response:
+                response.raise_for_status()
+                response_content = self._read_login_response(response)
+            if b"faultstring" in response_content:
+                raise Exception(f"SOAP Fault: {response_content.decode('utf-8')}")
             access_token = self._extract_access_token(response_content)
             instance_url = self._extract_instance_url(response_content)
             logger.info("Authentication successful")
             session.headers.update(self.get_headers(access_token))
             return session, instance_url
         except HTTPError as http_err:
-            logger.error(f"HTTP error occurred: {http_err}")
+            logger.error("HTTP error occurred: %s", http_err)
             raise
         except Exception as err:
-            logger.error(f"Other error occurred: {err}")
+            logger.error("Other error occurred: %s", err)
             raise
 
-    def _extract_access_token(self, response_content):
-        start_tag = "<sessionId>"
-        end_tag = "</sessionId>"
-        start_index = response_content.find(start_tag) + len(start_tag)
-        end_index = response_content.find(end_tag)
-        return response_content[start_index:end_index]
-
-    def _extract_instance_url(self, response_content):
-        start_tag = "<serverUrl>"
-        end_tag = "</serverUrl>"
-        start_index = response_content.find(start_tag) + len(start_tag)
-        end_index = response_content.find(end_tag)
-        server_url = response_content[start_index:end_index]
+    def _read_login_response(self, response: requests.Response) -> bytes:
+        # Stop reading once both the server url and session id have arrived;
+        # the userInfo block that follows them is never needed.
+        buffer = bytearray()
+        for chunk in response.iter_content(4096):
+            buffer += chunk
+            if b"</sessionId>" in buffer and b"</serverUrl>" in buffer:
+                break
+        return bytes(buffer)
+
+    def _extract_access_token(self, response_content: bytes) -> str:
+        match = _SESSION_RE.search(response_content)
+        if match is None:
+            raise ValueError("No sessionId found in login response")
+        return match.group(1).decode("utf-8")
+
+    def _extract_instance_url(self, response_content: bytes) -> str:
+        match = _SERVER_RE.search(response_content)
+        if match is None:
+            raise ValueError("No serverUrl found in login response")
+        server_url = match.group(1).decode("utf-8")
         instance_url = server_url.split("/services")[0]
         return instance_url
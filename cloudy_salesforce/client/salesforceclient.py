@@ -1,17 +1,20 @@
 from .auth import BaseAuthentication
 import logging
+import threading
 from requests.exceptions import HTTPError
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 from typing import Any, Dict, List, Type
+import orjson
 import requests
 
+JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class SalesforceClient:
     _default_instance = None
+    _default_lock = threading.Lock()
 
     def __init__(self, auth_strategy: BaseAuthentication):
         if not isinstance(auth_strategy, BaseAuthentication):
@@ -20,9 +23,10 @@ class SalesforceClient:
             )
         self.auth_strategy = auth_strategy
 
-        # Set the default instance directly
-        if self._default_instance is None:
-            self.__class__._default_instance = self
+        # Set the default instance if this is the first client created
+        with self._default_lock:
+            if self._default_instance is None:
+                self.__class__._default_instance = self
 
     @classmethod
     def set_default_instance(cls, auth_strategy: BaseAuthentication):
@@ -31,19 +35,29 @@ class SalesforceClient:
 
         :param auth_strategy: An instance of a subclass of BaseAuthentication.
         """
-        cls._default_instance = cls(auth_strategy)
+        instance = cls(auth_strategy)
+        with cls._default_lock:
+            cls._default_instance = instance
 
     @classmethod
-    def get_default_instance(cls):
+    def default(cls) -> "SalesforceClient":
         """
         Retrieves the default SalesforceClient instance.
 
         :return: The default SalesforceClient instance.
         :raises ValueError: If the default instance has not been set.
         """
-        if cls._default_instance is None:
+        instance = cls._default_instance
+        if instance is None:
             raise ValueError("Default instance not set")
-        return cls._default_instance
+        return instance
+
+    @classmethod
+    def get_default_instance(cls) -> "SalesforceClient":
+        """
+        Retrieves the default SalesforceClient instance. Alias of default().
+        """
+        return cls.default()
 
     def get_session(self) -> requests.Session:
         return self.auth_strategy.session
@@ -59,16 +73,24 @@ class SalesforceClient:
         params: dict | None = None,
     ) -> Dict[str, Any] | List[Dict[str, Any]]:
         request_url = f"{self.get_instance_url()}{url}"
+        data = orjson.dumps(body) if body is not None else None
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request %s %s params=%s", method, request_url, params)
         try:
             response = self.get_session().request(
-                method, request_url, json=body, params=params
+                method, request_url, data=data, params=params, headers=JSON_HEADERS
             )
-            response.raise_for_status()
-            return response.json()
+            if response.status_code >= 400:
+                response.raise_for_status()
+            content = response.content
+            # e.g. 204 No Content
+            if not content:
+                return []
+            return orjson.loads(content)
 
         except HTTPError as http_err:
-            logger.error(f"HTTP error occurred during query: {http_err}")
+            logger.error("HTTP error occurred during query: %s", http_err)
             raise
         except Exception as err:
-            logger.error(f"Other error occurred during query: {err}")
+            logger.error("Other error occurred during query: %s", err)
             raise
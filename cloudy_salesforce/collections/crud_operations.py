@@ -1,12 +1,13 @@
-from enum import Enum
-from functools import partial, wraps
-import json
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, wraps
 import logging
 from typing import (
     Any,
     Callable,
     Dict,
     Generic,
+    Iterator,
     List,
     Optional,
     Tuple,
@@ -22,15 +23,20 @@ from .return_functions import records_and_response, response_json_only
 # Assuming SalesforceClient is imported correctly
 from ..client import SalesforceClient
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
 T = TypeVar("T")
 
+# Batches sent at once when the props do not set max_workers
+DEFAULT_MAX_WORKERS = 4
 
-class CRUDProps(TypedDict):
+
+class _CRUDOptions(TypedDict, total=False):
+    max_workers: int
+
+
+class CRUDProps(_CRUDOptions):
     client: SalesforceClient
     object_type: str
     records: List[dict]
@@ -39,15 +45,16 @@ class CRUDProps(TypedDict):
 
 
 class InsertProps(CRUDProps):
-    pass
+    copy_attributes: bool
 
 
 class UpdateProps(CRUDProps):
-    pass
+    copy_attributes: bool
 
 
 class UpsertProps(CRUDProps):
     external_id_field: Optional[str]  # defaults to "Id"
+    copy_attributes: bool
 
 
 class DeleteProps(CRUDProps):
@@ -63,6 +70,10 @@ COLLECTION_METHODS = {
     "delete": "DELETE",
 }
 
+_INSERT_URL = "/services/data/v60.0/composite/sobjects/"
+_UPSERT_URL = "/services/data/v61.0/composite/sobjects/"
+_DELETE_URL = "/services/data/v61.0/composite/sobjects"
+
 
 def collections(
     operation: CRUDLiteral,
@@ -70,31 +81,74 @@ def collections(
         [List[Dict[str, Any]], List[Dict[str, Any]]], T
     ] = response_json_only,
 ) -> Callable[[Callable[..., CRUDProps]], Callable[..., T]]:
+    """
+    Turns a function returning CRUDProps into a collections DML call.
+
+    Records are sent in batches of batch_size, with up to max_workers batches
+    in flight at once (DEFAULT_MAX_WORKERS if the props leave it out). If a
+    batch fails, no further batches are sent and the error is re-raised once
+    the batches already in flight have finished. Those batches, and any that
+    completed before the failure, stay applied in Salesforce, and their
+    results are not returned.
+    """
+    method = COLLECTION_METHODS[operation]
+
     def decorator(func: Callable[..., CRUDProps]) -> Callable[..., T]:
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
             props: CRUDProps = func(*args, **kwargs)
             client = props["client"]
             records_to_process = props["records"]
+            object_type = props["object_type"]
+            all_or_none = props["all_or_none"]
+            external_id_field = props.get("external_id_field")
+            copy_attributes = props.get("copy_attributes", False)
 
-            crud_function = partial(client.request, COLLECTION_METHODS[operation])
+            crud_function = client.request
 
+            max_workers = props.get("max_workers", DEFAULT_MAX_WORKERS)
             results: List[Dict[str, Any]] = []
+            in_flight: deque[Future] = deque()
 
-            # batch records
-            for records in batch_records(records_to_process, props["batch_size"]):
-                url, body, params = build_payload(
-                    operation, {**props, "records": records}
-                )
-
-                dml_response = crud_function(url=url, body=body, params=params)
-
+            def collect(future: Future) -> None:
+                dml_response = future.result()
                 if not isinstance(dml_response, list):
                     raise ValueError(
                         f"Expected a list of responses, but received: {dml_response}"
                     )
                 results.extend(dml_response)
 
+            # send up to max_workers batches at a time, collecting results in
+            # submission order
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                try:
+                    for records in batch_records(
+                        records_to_process, props["batch_size"]
+                    ):
+                        url, body, params = build_payload(
+                            operation,
+                            records,
+                            object_type,
+                            all_or_none,
+                            external_id_field,
+                            copy_attributes,
+                        )
+                        in_flight.append(
+                            executor.submit(
+                                crud_function, method, url=url, body=body, params=params
+                            )
+                        )
+                        if len(in_flight) >= max_workers:
+                            collect(in_flight.popleft())
+                    while in_flight:
+                        collect(in_flight.popleft())
+                except BaseException:
+                    # stop any batch that has not started; batches already in
+                    # flight still finish before the error is re-raised
+                    for future in in_flight:
+                        future.cancel()
+                    raise
+
             return return_function(records_to_process, results)
 
         return wrapper
@@ -109,7 +163,9 @@ def insert(
     all_or_none: bool = True,
     batch_size: int = 200,
     client: SalesforceClient | None = None,
-) -> CRUDProps:
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    copy_attributes: bool = False,
+) -> InsertProps:
     if client is None:
         client = SalesforceClient.get_default_instance()
     return {
@@ -118,6 +174,8 @@ def insert(
         "records": records,
         "all_or_none": all_or_none,
         "batch_size": batch_size,
+        "max_workers": max_workers,
+        "copy_attributes": copy_attributes,
     }
 
 
@@ -128,6 +186,8 @@ def update(
     all_or_none: bool = True,
     batch_size: int = 200,
     client: SalesforceClient | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    copy_attributes: bool = False,
 ) -> UpdateProps:
     if client is None:
         client = SalesforceClient.get_default_instance()
@@ -137,6 +197,8 @@ def update(
         "records": records,
         "all_or_none": all_or_none,
         "batch_size": batch_size,
+        "max_workers": max_workers,
+        "copy_attributes": copy_attributes,
     }
 
 
@@ -148,6 +210,8 @@ def upsert(
     all_or_none: bool = True,
     batch_size: int = 200,
     client: SalesforceClient | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    copy_attributes: bool = False,
 ) -> UpsertProps:
     if client is None:
         client = SalesforceClient.get_default_instance()
@@ -158,6 +222,8 @@ def upsert(
         "external_id_field": external_id_field,
         "all_or_none": all_or_none,
         "batch_size": batch_size,
+        "max_workers": max_workers,
+        "copy_attributes": copy_attributes,
     }
 
 
@@ -168,6 +234,7 @@ def delete(
     all_or_none: bool = True,
     batch_size: int = 200,
     client: SalesforceClient | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
 ) -> DeleteProps:
     if client is None:
         client = SalesforceClient.get_default_instance()
@@ -177,60 +244,72 @@ def delete(
         "records": records,
         "all_or_none": all_or_none,
         "batch_size": batch_size,
+        "max_workers": max_workers,
     }
 
 
 # a function that batches a list of records into chunks of size batch_size
-def batch_records(records: List[dict], batch_size: int) -> List[List[dict]]:
-    return [records[i : i + batch_size] for i in range(0, len(records), batch_size)]
-
-
-def add_attributes(records: List[dict], object_type: str) -> List[dict]:
-    for record in records:
-        record["attributes"] = {"type": object_type}
+def batch_records(records: List[dict], batch_size: int) -> Iterator[List[dict]]:
+    for i in range(0, len(records), batch_size):
+        yield records[i : i + batch_size]
+
+
+def add_attributes(
+    records: List[dict], object_type: str, copy_attributes: bool = False
+) -> List[dict]:
+    """
+    Sets the "attributes" entry on each record.
+
+    By default every record shares a single attributes dict, so mutating one
+    record's attributes affects them all. Pass copy_attributes=True (also
+    accepted by insert, update and upsert) to give each record its own dict.
+    """
+    attributes = {"type": object_type}
+    if copy_attributes:
+        for record in records:
+            record["attributes"] = attributes.copy()
+    else:
+        for record in records:
+            record["attributes"] = attributes
     return records
 
 
 # Case insensitive function to get id's from records
 def get_id_list(records: List[dict]) -> List[str]:
-    ids = []
-    for record in records:
-        if "Id" in record:
-            ids.append(record["Id"])
-        elif "id" in record:
-            ids.append(record["id"])
-        else:
-            raise ValueError(f"Record does not contain an Id/id field: {record}")
+    ids = [record.get("Id") or record.get("id") for record in records]
+    if None in ids:
+        record = records[ids.index(None)]
+        raise ValueError(f"Record does not contain an Id/id field: {record}")
     return ids
 
 
+@lru_cache(maxsize=256)
+def _endpoint(
+    operation: CRUDLiteral, object_type: str, external_id: str | None = None
+) -> str:
+    if operation == "delete":
+        return _DELETE_URL
+    if operation == "upsert":
+        return f"{_UPSERT_URL}{object_type}/{external_id or 'Id'}"
+    return _INSERT_URL
+
+
 def build_payload(
     operation: CRUDLiteral,
-    props: CRUDProps,
+    records: List[dict],
+    object_type: str,
+    all_or_none: bool,
+    external_id_field: str | None = None,
+    copy_attributes: bool = False,
 ) -> Tuple[str, dict | None, dict | None]:
-    records = props["records"]
-    all_or_none = props["all_or_none"]
+    url = _endpoint(operation, object_type, external_id_field)
 
     if operation == "delete":
         params = {"ids": ",".join(get_id_list(records)), "allOrNone": all_or_none}
-        return (
-            f"/services/data/v61.0/composite/sobjects?ids={','.join(get_id_list(records))}&allOrNone={all_or_none}",
-            None,
-            params,
-        )
-
-    object_type = props["object_type"]
-    body = {"allOrNone": all_or_none, "records": add_attributes(records, object_type)}
+        return url, None, params
 
-    if operation == "upsert":
-        if "external_id_field" in props and props["external_id_field"] is not None:
-            external_id = props["external_id_field"]
-        else:
-            external_id = "Id"
-        return (
-            f"/services/data/v61.0/composite/sobjects/{object_type}/{external_id}",
-            body,
-            None,
-        )
-
-    return f"/services/data/v60.0/composite/sobjects/", body, None
+    body = {
+        "allOrNone": all_or_none,
+        "records": add_attributes(records, object_type, copy_attributes),
+    }
+    return url, body, None
@@ -1,8 +1,6 @@
 from typing import Any, Dict, List, Tuple, TypeVar
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
@@ -15,30 +13,47 @@ def response_json_only(records: List[Dict[str, Any]], results: T) -> T:
 def records_and_response(
     records: List[Dict[str, Any]], results: List[Dict[str, Any]]
 ) -> List[Dict[str, Any]]:
-    parsed_results: List[Dict[str, Any]] = []
-    for record, response in zip(records, results):
-        record_result = {"record": record, "response": response}
-        parsed_results.append(record_result)
-
-    return parsed_results
+    return [
+        {"record": record, "response": response}
+        for record, response in zip(records, results, strict=True)
+    ]
 
 
 def success_failure(
-    records: List[Dict[str, Any]], results: List[Dict[str, Any]]
+    records: List[Dict[str, Any]],
+    results: List[Dict[str, Any]],
+    keep_success_results: bool = True,
 ) -> Tuple[Dict, Dict]:
-    successes = {"count": 0, "results": []}
-    failures = {"count": 0, "results": []}
-    for record, response in zip(records, results):
-        record_result = {"record": record, "response": response}
+    """
+    Splits the dml results into successes and failures.
+
+    collections calls its return_function with records and results only, so
+    to skip collecting successes bind the flag first, e.g.
+    ``collections("insert", partial(success_failure, keep_success_results=False))``.
+
+    :param keep_success_results: Defaults to True, matching the original
+        return value. When False, successes are only counted and their
+        per-record results are not collected.
+    """
+    success_results: List[Dict[str, Any]] = []
+    failure_results: List[Dict[str, Any]] = []
+    success_append = success_results.append
+    failure_append = failure_results.append
+    for record, response in zip(records, results, strict=True):
         if not response["success"]:
-            failures["count"] += 1
-            failures["results"].append(record_result)
-        else:
-            successes["count"] += 1
-            successes["results"].append(record_result)
+            failure_append({"record": record, "response": response})
+        elif keep_success_results:
+            success_append({"record": record, "response": response})
+
+    failures = {"count": len(failure_results), "results": failure_results}
+    successes = {
+        "count": len(results) - len(failure_results),
+        "results": success_results,
+    }
 
     # log the results
-    logger.info(f"---Results for dml:---")
-    logger.info(f"Successes: {successes['count']}")
-    logger.info(f"Failures: {failures['count']}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("---Results for dml:---")
+        logger.info("Successes: %d", successes["count"])
+        logger.info("Failures: %d", failures["count"])
     return successes, failures
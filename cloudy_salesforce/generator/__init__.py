@@ -1 +1,8 @@
-from .generator import SObjectGenerator
+def __getattr__(name):
+    # SObjectGenerator pulls in jinja2 and requests, so only import it on first
+    # use; this keeps the CLI entry point cheap to load.
+    if name == "SObjectGenerator":
+        from .generator import SObjectGenerator
+
+        return SObjectGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,24 +1,24 @@
-import json
-from .generator import SObjectGenerator
-from cloudy_salesforce.client import UsernamePasswordAuthentication
+import orjson
 
 import argparse
-import sys
+import logging
 import os
-from dotenv import load_dotenv, find_dotenv
 
 
 def generate(args):
     """
     Handle the 'generate' command.
     """
+    # imported here so --help and argument errors skip jinja2 and requests
+    from .generator import SObjectGenerator
+
     sobjects = args.sobjects
     alias_name = args.alias
     print(f"Generating code with sobjects={sobjects} and alias={alias_name}")
 
     # load auth details
-    with open(".cloudy_config", "r") as file:
-        config = json.load(file)
+    with open(".cloudy_config", "rb") as file:
+        config = orjson.loads(file.read())
         assert config
         assert config["auth"]
 
@@ -31,10 +31,17 @@ def generate(args):
 
     def get_auth(alias):
         if alias["type"] == "basic":
-            load_dotenv(dotenv_path=find_dotenv(raise_error_if_not_found=True))
-            username = os.getenv(alias["credentials"]["username"])
-            password = os.getenv(alias["credentials"]["password"])
-            security_token = os.environ.get(alias["credentials"]["security_token"])
+            from dotenv import load_dotenv, find_dotenv
+            from cloudy_salesforce.client import UsernamePasswordAuthentication
+
+            # search from the working directory, next to .cloudy_config
+            dotenv_path = find_dotenv(raise_error_if_not_found=True, usecwd=True)
+            load_dotenv(dotenv_path=dotenv_path)
+            env = os.environ
+            credentials = alias["credentials"]
+            username = env.get(credentials["username"])
+            password = env.get(credentials["password"])
+            security_token = env.get(credentials["security_token"])
 
             # need to add params like sandbox and url
             return UsernamePasswordAuthentication(
@@ -45,11 +52,15 @@ def generate(args):
 
     auth = get_auth(alias)
 
-    generator = SObjectGenerator(auth)
+    generator = SObjectGenerator(
+        auth, config=config, use_describe_cache=not args.no_cache
+    )
     generator.generate_all(sobjects)
 
 
 def main():
+    logging.basicConfig(level=logging.INFO)
+
     parser = argparse.ArgumentParser(
         description="Your Package CLI", usage="%(prog)s [command] [options]"
     )
@@ -70,6 +81,11 @@ def main():
     generate_parser.add_argument(
         "--alias", "-a", default="default", help="Description for option2."
     )
+    generate_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached sobject describes and fetch them from Salesforce.",
+    )
     generate_parser.set_defaults(func=generate)
 
     # Parse the arguments
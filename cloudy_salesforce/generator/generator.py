@@ -1,11 +1,17 @@
-import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import os
-from jinja2 import Environment, PackageLoader
-from typing import List, TypedDict
+from pathlib import Path
+import orjson
+from typing import TYPE_CHECKING, List, TypedDict
 
 from cloudy_salesforce.client import SalesforceClient
 from cloudy_salesforce.client.auth import BaseAuthentication
 from cloudy_salesforce.sobjects import SObject
+from cloudy_salesforce.sobjects.sobject import DESCRIBE_CACHE_TTL
+
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template
 
 
 class FieldDict(TypedDict):
@@ -26,17 +32,18 @@ class SObjectGenerator:
         template_dir: str = "templates",
         template_name: str = "sobject.jinja2",
         output_dir: str = "sobjects",
+        config: dict | None = None,
+        use_describe_cache: bool = False,
     ):
         self.sf_client = SalesforceClient(auth_strategy=authentication)
+        # already parsed .cloudy_config, if the caller has one
+        self.config = config
+        self.use_describe_cache = use_describe_cache
 
-        env = Environment(
-            loader=PackageLoader("cloudy_salesforce.generator", template_dir)
-        )
-        self.template = env.get_template(template_name)
+        self.template = _get_template(template_dir, template_name)
         self.output_dir = output_dir
 
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
+        os.makedirs(self.output_dir, exist_ok=True)
 
     def get_objects(
         self,
@@ -45,10 +52,13 @@ class SObjectGenerator:
     ) -> List[ObjectDict]:
         # First step is to get the object names
         # 1. config json file
-        if not object_names:
+        if not object_names and self.config is not None:
+            object_names = self.config["sobjects"]
+            assert object_names
+        elif not object_names:
             try:
-                with open(path, "r") as file:
-                    object_names = json.load(file)["sobjects"]
+                with open(path, "rb") as file:
+                    object_names = orjson.loads(file.read())["sobjects"]
                     assert object_names
             except FileNotFoundError:
                 raise FileNotFoundError(
@@ -59,7 +69,10 @@ class SObjectGenerator:
         if isinstance(object_names, str):
             object_names = [object_names]
         # 3. passed in as a list of strings
-        sobject_client = SObject(sf_client=self.sf_client)
+        sobject_client = SObject(
+            sf_client=self.sf_client,
+            cache_ttl=DESCRIBE_CACHE_TTL if self.use_describe_cache else None,
+        )
 
         object_field_dict = sobject_client.get_object_fields(object_names)
         gen_objects = []
@@ -76,11 +89,19 @@ class SObjectGenerator:
     ):
         objects = self.get_objects(object_names, path)
         class_names = [obj["class_name"] for obj in objects]
-        for obj in objects:
-            self.generate(obj["class_name"], obj["fields"])
+        if objects:
+            # each sobject renders to its own file, so they can be written concurrently
+            with ThreadPoolExecutor(max_workers=min(16, len(objects))) as executor:
+                futures = [
+                    executor.submit(self.generate, obj["class_name"], obj["fields"])
+                    for obj in objects
+                ]
+                # report progress from this thread so lines never interleave
+                for future in futures:
+                    print(f"{future.result()} generated.")
         self.generate_init_file(class_names)
 
-    def generate(self, sobject: str, fields: List[FieldDict]):
+    def generate(self, sobject: str, fields: List[FieldDict]) -> str:
         prepared_fields = [(f["name"], f["type"]) for f in fields]
         picklist_fields = [(f["type"], f["picklist"]) for f in fields if f["picklist"]]
 
@@ -92,42 +113,75 @@ class SObjectGenerator:
 
         absolute_path = os.path.join(self.output_dir, f"{sobject}.py")
 
-        with open(absolute_path, "w") as file:
-            file.write(generated_file)
-        print(f"{absolute_path} generated.")
+        Path(absolute_path).write_text(generated_file)
+        return absolute_path
 
     def generate_init_file(self, class_names: List[str]):
         init_file_path = os.path.join(self.output_dir, "__init__.py")
-        with open(init_file_path, "w") as file:
-            for class_name in class_names:
-                file.write(f"from .{class_name} import {class_name}\n")
+        body = "".join(
+            f"from .{class_name} import {class_name}\n" for class_name in class_names
+        )
+        Path(init_file_path).write_text(body)
         print(f"{init_file_path} generated.")
 
     # ------------------------------------------------#
 
     def parse_sf_fields(self, fields: List[dict]) -> List[FieldDict]:
-        field_dict_list = []
-        for field in fields:
-            field_name = field["name"]
-            field_type = parse_type(field_name, field["type"])
-            picklist = (
-                field.get("picklistValues") if field["type"] == "picklist" else None
-            )
-            if picklist:
-                picklist = [item["value"] for item in picklist if item["active"]]
-            field_dict_list.append(
-                FieldDict(name=field_name, type=field_type, picklist=picklist)
-            )
-        return field_dict_list
+        type_map = salesforce_to_python_type_map
+        return [
+            {
+                "name": field["name"],
+                "type": (
+                    picklist_type_name(field["name"])
+                    if field["type"] == "picklist"
+                    else type_map.get(field["type"], "str")
+                ),
+                "picklist": (
+                    [
+                        item["value"]
+                        for item in field.get("picklistValues") or ()
+                        if item["active"]
+                    ]
+                    if field["type"] == "picklist"
+                    else None
+                ),
+            }
+            for field in fields
+        ]
+
+
+@lru_cache(maxsize=None)
+def _get_environment(template_dir: str) -> "Environment":
+    # jinja2 is imported here so importing this module stays cheap
+    from jinja2 import Environment, FileSystemBytecodeCache, PackageLoader
+
+    # Compiled templates are also cached on disk so repeated CLI runs skip
+    # parsing and compiling them.
+    return Environment(
+        loader=PackageLoader("cloudy_salesforce.generator", template_dir),
+        auto_reload=False,
+        cache_size=400,
+        bytecode_cache=FileSystemBytecodeCache(),
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_template(template_dir: str, template_name: str) -> "Template":
+    return _get_environment(template_dir).get_template(template_name)
+
+
+_UNDERSCORE_TABLE = str.maketrans("", "", "_")
+
+
+def picklist_type_name(field_name: str) -> str:
+    # Remove all underscores, convert to uppercase, and append PICKLIST
+    return f"{field_name.translate(_UNDERSCORE_TABLE).upper()}PICKLIST"
 
 
 def parse_type(field_name: str, field_type: str) -> str:
     if field_type == "picklist":
-        # Remove all underscores, convert to uppercase, and append PICKLIST
-        field_name = field_name.replace("_", "")
-        field_name = f"{field_name.upper()}PICKLIST"
-        return field_name
-    return salesforce_to_python_type_map[field_type]
+        return picklist_type_name(field_name)
+    return salesforce_to_python_type_map.get(field_type, "str")
 
 
 salesforce_to_python_type_map = {
@@ -1,6 +1,9 @@
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import partial, wraps
-import json
+from itertools import islice
 import logging
+import re
 from typing import Any, Callable, Dict, List, Literal, TypedDict, TypeVar
 
 from cloudy_salesforce.client.salesforceclient import SalesforceClient
@@ -15,24 +18,27 @@ class QueryProps(TypedDict):
     soql_query: str
 
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
 QueryEnpoints = Literal["query", "queryAll"]
 
+# nextRecordsUrl has the form /services/data/vXX.X/query/<locator>-<offset>
+_NEXT_RECORDS_RE = re.compile(r"^(?P<base>.+-)(?P<offset>\d+)$")
+MAX_PAGE_WORKERS = 8
+
 
 def soql_query(
     endpoint: QueryEnpoints = "query",
     return_function: Callable[[Dict[str, Any]], T] = response_json_only,
 ) -> Callable[[Callable[..., QueryProps]], Callable[..., T]]:
+    url = f"/services/data/v52.0/{endpoint}"
+
     def decorator(func: Callable[..., QueryProps]) -> Callable[..., T]:
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
             props: QueryProps = func(*args, **kwargs)
             client = props["client"]
-            url = f"/services/data/v52.0/{endpoint}"
             params = {"q": props["soql_query"]}
 
             crud_function = partial(client.request, "GET")
@@ -44,29 +50,126 @@ def soql_query(
                 "nextRecordsUrl": None,
             }
 
-            def query_all(url, params, results):
-                while not results["done"] and url is not None:
-                    query_response = crud_function(url=url, body=None, params=params)
-                    if not isinstance(query_response, dict):
-                        raise ValueError(
-                            f"Expected a dict of responses, but received: {query_response}"
+            def fetch_page(url, params=None):
+                query_response = crud_function(url=url, body=None, params=params)
+                if not isinstance(query_response, dict):
+                    raise ValueError(
+                        f"Expected a dict of responses, but received: {query_response}"
+                    )
+                return query_response
+
+            def prefetch_pages(next_url, records, offset, page_size, total_size):
+                """
+                Fetches the remaining pages concurrently by deriving the page
+                urls from next_url, storing them in records in order. At the
+                first page that does not line up, no further pages are
+                requested and the caller walks on serially from that page's
+                nextRecordsUrl. Returns None if the url is not in the expected
+                format, otherwise the new offset and the last page stored.
+                """
+                match = _NEXT_RECORDS_RE.match(next_url)
+                if match is None or int(match["offset"]) != offset or page_size == 0:
+                    return None
+                # keep at most MAX_PAGE_WORKERS pages in flight so a mismatch
+                # wastes as few API calls as possible
+                page_offsets = iter(range(offset, total_size, page_size))
+                in_flight: deque[tuple[int, Future]] = deque()
+                with ThreadPoolExecutor(max_workers=MAX_PAGE_WORKERS) as executor:
+
+                    def submit(page_offset: int) -> None:
+                        page_url = f"{match['base']}{page_offset}"
+                        in_flight.append(
+                            (page_offset, executor.submit(fetch_page, page_url))
                         )
-                    results["records"].extend(query_response["records"])
+
+                    for page_offset in islice(page_offsets, MAX_PAGE_WORKERS):
+                        submit(page_offset)
+                    while in_flight:
+                        page_offset, future = in_flight.popleft()
+                        query_response = future.result()
+                        page = query_response["records"]
+                        records[page_offset : page_offset + len(page)] = page
+                        offset = page_offset + len(page)
+                        if len(page) != min(page_size, total_size - page_offset):
+                            break
+                        next_offset = next(page_offsets, None)
+                        if next_offset is not None:
+                            submit(next_offset)
+                return offset, query_response
+
+            def query_all(url, params, results, prefetch=True):
+                records = results["records"]
+                offset = len(records)
+                while not results["done"] and url is not None:
+                    query_response = fetch_page(url, params)
+                    # size the list for the whole result set once, then fill it
+                    # page by page instead of growing it on every extend
+                    total_size = query_response["totalSize"]
+                    if len(records) < total_size:
+                        records.extend([None] * (total_size - len(records)))
+                    page = query_response["records"]
+                    records[offset : offset + len(page)] = page
+                    offset += len(page)
+
                     results["done"] = query_response["done"]
-                    results["totalSize"] = query_response["totalSize"]
+                    results["totalSize"] = total_size
                     results["nextRecordsUrl"] = query_response.get("nextRecordsUrl")
 
                     url = results["nextRecordsUrl"]
                     params = None
 
+                    # once the page size is known, fetch the rest in parallel
+                    if prefetch and not results["done"] and url is not None:
+                        prefetch = False
+                        prefetched = prefetch_pages(
+                            url, records, offset, len(page), total_size
+                        )
+                        if prefetched is not None:
+                            offset, query_response = prefetched
+                            results["done"] = query_response["done"]
+                            results["nextRecordsUrl"] = query_response.get(
+                                "nextRecordsUrl"
+                            )
+                            url = results["nextRecordsUrl"]
+                # drop any unused slots if fewer records came back than reported
+                del records[offset:]
+
             query_all(url, params, results)
 
             def handle_nested_queries(records: List[Dict[str, Any]]) -> None:
-                for record in records:
-                    for key, value in record.items():
-                        if isinstance(value, dict) and "nextRecordsUrl" in value:
-                            query_all(value["nextRecordsUrl"], None, value)
-                            handle_nested_queries(value["records"])
+                # walk the subquery results level by level, fetching every
+                # unfinished subquery of a level concurrently. Each subquery
+                # is walked serially (no page prefetch) so at most
+                # MAX_PAGE_WORKERS requests are in flight at once.
+                level = records
+                while level:
+                    subqueries = [
+                        value
+                        for record in level
+                        for value in record.values()
+                        if isinstance(value, dict) and "records" in value
+                    ]
+                    pending = [
+                        value for value in subqueries if "nextRecordsUrl" in value
+                    ]
+                    if pending:
+                        workers = min(MAX_PAGE_WORKERS, len(pending))
+                        with ThreadPoolExecutor(max_workers=workers) as executor:
+                            futures = [
+                                executor.submit(
+                                    query_all,
+                                    value["nextRecordsUrl"],
+                                    None,
+                                    value,
+                                    prefetch=False,
+                                )
+                                for value in pending
+                            ]
+                            for future in futures:
+                                future.result()
+                    level = [
+                        child for value in subqueries for child in value["records"]
+                    ]
 
             handle_nested_queries(results["records"])
 
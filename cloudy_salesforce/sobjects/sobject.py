@@ -1,12 +1,43 @@
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import logging
+import os
+import threading
+import time
 from typing import List
+
+import orjson
+
 from cloudy_salesforce.client import SalesforceClient
 
+logger = logging.getLogger(__name__)
+
+API_VERSION = "v61.0"
+
+# Describe responses are cached on disk, keyed by org, api version and sobject
+DESCRIBE_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "cloudy_salesforce",
+    "describe",
+)
+DESCRIBE_CACHE_TTL = 24 * 60 * 60  # seconds
+
 
 class SObject:
-    def __init__(self, sf_client: SalesforceClient | None = None):
+    def __init__(
+        self,
+        sf_client: SalesforceClient | None = None,
+        cache_ttl: int | None = None,
+    ):
+        """
+        :param cache_ttl: Seconds a cached describe response stays fresh.
+            None (the default) disables the on-disk describe cache.
+        """
         if sf_client is None:
             sf_client = SalesforceClient.get_default_instance()
         self.sf_client = sf_client
+        self.cache_ttl = cache_ttl
 
     # Should go in the sobject folder
     def describe_sobject(self, sobject) -> dict:
@@ -20,20 +51,74 @@ class SObject:
         Returns:
         dict: The description of the specified sObject.
         """
+        cache_path = self._describe_cache_path(sobject) if self.cache_ttl else None
+        if cache_path is not None:
+            cached = _read_cache(cache_path, self.cache_ttl)
+            if cached is not None:
+                response, age = cached
+                logger.info(
+                    "Using cached describe for %s from %d minutes ago "
+                    "(run generate with --no-cache to refresh it)",
+                    sobject,
+                    age // 60,
+                )
+                return response
+
         # Build the URL for the describe API endpoint
-        url = f"/services/data/v61.0/sobjects/{sobject}/describe/"
+        url = f"/services/data/{API_VERSION}/sobjects/{sobject}/describe/"
 
         # Make the API call to get the sObject description
         response = self.sf_client.request("GET", url)
-        if type(response) is dict:
+        if isinstance(response, Mapping):
+            if cache_path is not None:
+                _write_cache(cache_path, response)
             return response
         else:
             raise Exception(f"Error with describe_sobject: {response}")
 
+    def _describe_cache_path(self, sobject: str) -> str | None:
+        # Describes depend on the user's field permissions, so entries are
+        # per user; without a known user nothing is cached.
+        username = getattr(self.sf_client.auth_strategy, "username", None)
+        if not username:
+            return None
+        instance_url = self.sf_client.get_instance_url()
+        key = hashlib.blake2b(
+            f"{instance_url}|{username}|{API_VERSION}|{sobject}".encode(),
+            digest_size=16,
+        ).hexdigest()
+        return os.path.join(DESCRIBE_CACHE_DIR, f"{key}.json")
+
     def get_object_fields(self, objects: List[str]) -> dict[str, List[dict]]:
-        object_field_dict = {}
-        for ob in objects:
-            response = self.describe_sobject(ob)
-            fields = response["fields"]
-            object_field_dict[ob] = fields
-        return object_field_dict
+        if not objects:
+            return {}
+        # describe calls are independent, so fetch them concurrently
+        with ThreadPoolExecutor(max_workers=min(16, len(objects))) as executor:
+            responses = executor.map(self.describe_sobject, objects)
+            return {ob: response["fields"] for ob, response in zip(objects, responses)}
+
+
+def _read_cache(path: str, ttl: int) -> tuple[dict, float] | None:
+    # returns the cached response and its age in seconds
+    try:
+        age = time.time() - os.path.getmtime(path)
+        if age > ttl:
+            return None
+        with open(path, "rb") as file:
+            return orjson.loads(file.read()), age
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def _write_cache(path: str, response: dict) -> None:
+    # write to a temporary file first so concurrent readers never see a
+    # partially written entry
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        data = orjson.dumps(response)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "wb") as file:
+            file.write(data)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError) as err:
+        logger.debug("Could not write describe cache %s: %s", path, err)